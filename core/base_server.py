@@ -5,9 +5,14 @@ Provides common functionality for all MCP servers
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 import logging
+import os
+import orjson
 
 logger = logging.getLogger('BaseMCPServer')
 
+# Tool results go over the wire compact; set MCP_PRETTY_JSON=1 to indent them for debugging
+RESULT_JSON_OPTION = orjson.OPT_INDENT_2 if os.getenv('MCP_PRETTY_JSON') else 0
+
 
 class BaseMCPServer(ABC):
     """Abstract base class for MCP servers"""
@@ -81,9 +86,7 @@ class BaseMCPServer(ABC):
         Returns:
             Formatted response following MCP protocol
         """
-        import json
-        
-        result_text = json.dumps(result, ensure_ascii=False, indent=2)
+        result_text = orjson.dumps(result, option=RESULT_JSON_OPTION).decode()
         
         return {
             "content": [
@@ -2,8 +2,10 @@
 Server Registry
 Manages multiple MCP servers and routes requests
 """
-from typing import Dict, Optional, List, Any
+from typing import Awaitable, Callable, Dict, Optional, List, Any
+import functools
 import logging
+import orjson
 from core.base_server import BaseMCPServer
 
 logger = logging.getLogger('ServerRegistry')
@@ -15,7 +17,13 @@ class ServerRegistry:
     def __init__(self):
         """Initialize server registry"""
         self._servers: Dict[str, BaseMCPServer] = {}
+        # Tool lookups, rebuilt whenever the set of servers changes
+        self._tools_cache: List[Dict[str, Any]] = []
+        self._tools_json = b"[]"
+        self._server_info_json = b"{}"
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {}
         self.logger = logger
+        self._rebuild_tool_index()
     
     def register(self, server: BaseMCPServer) -> None:
         """
@@ -28,6 +36,7 @@ class ServerRegistry:
             self.logger.warning(f"Server '{server.name}' already registered, replacing...")
         
         self._servers[server.name] = server
+        self._rebuild_tool_index()
         self.logger.info(f"Registered server: {server.name} v{server.version}")
     
     def unregister(self, server_name: str) -> None:
@@ -39,6 +48,7 @@ class ServerRegistry:
         """
         if server_name in self._servers:
             del self._servers[server_name]
+            self._rebuild_tool_index()
             self.logger.info(f"Unregistered server: {server_name}")
         else:
             self.logger.warning(f"Server '{server_name}' not found")
@@ -70,29 +80,48 @@ class ServerRegistry:
             for server in self._servers.values()
         ]
     
-    def get_all_tools(self) -> List[Dict[str, Any]]:
-        """
-        Get all tools from all registered servers
-        
-        Returns:
-            List of all tools with server prefix
-        """
+    def _rebuild_tool_index(self) -> None:
+        """Rebuild the cached tool list and tool-name dispatch table"""
         all_tools = []
+        dispatch = {}
         
         for server_name, server in self._servers.items():
             tools = server.get_tools()
             
             # Add server prefix to tool names for namespacing
             for tool in tools:
-                prefixed_tool = tool.copy()
                 # Store original tool name and server name for routing
-                prefixed_tool['_server'] = server_name
-                prefixed_tool['_original_name'] = tool['name']
                 # Optional: prefix tool name with server name
-                # prefixed_tool['name'] = f"{server_name}_{tool['name']}"
-                all_tools.append(prefixed_tool)
+                # (add "name": f"{server_name}_{tool['name']}" to the merge)
+                all_tools.append(tool | {'_server': server_name, '_original_name': tool['name']})
+                
+                # First registered server wins on duplicate tool names
+                if tool['name'] not in dispatch:
+                    dispatch[tool['name']] = functools.partial(server.call_tool, tool['name'])
         
-        return all_tools
+        self._tools_cache = all_tools
+        self._dispatch = dispatch
+        # Pre-serialized forms for the HTTP layer
+        self._tools_json = orjson.dumps(all_tools)
+        self._server_info_json = orjson.dumps(self.get_combined_server_info())
+    
+    def get_all_tools(self) -> List[Dict[str, Any]]:
+        """
+        Get all tools from all registered servers
+        
+        Returns:
+            List of all tools with server prefix (cached; do not mutate)
+        """
+        return self._tools_cache
+    
+    def get_all_tools_json(self) -> bytes:
+        """
+        Get all tools as pre-serialized JSON
+        
+        Returns:
+            JSON array of get_all_tools(), cached until servers change
+        """
+        return self._tools_json
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any], server_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -118,15 +147,12 @@ class ServerRegistry:
             
             return await server.call_tool(tool_name, arguments)
         
-        # Search all servers for the tool
-        for server in self._servers.values():
-            tools = server.get_tools()
-            tool_names = [t['name'] for t in tools]
-            
-            if tool_name in tool_names:
-                return await server.call_tool(tool_name, arguments)
+        # Route by tool name
+        handler = self._dispatch.get(tool_name)
+        if not handler:
+            raise ValueError(f"Tool '{tool_name}' not found in any registered server")
         
-        raise ValueError(f"Tool '{tool_name}' not found in any registered server")
+        return await handler(arguments)
     
     def get_combined_server_info(self) -> Dict[str, Any]:
         """
@@ -143,3 +169,12 @@ class ServerRegistry:
             "servers": servers,
             "count": len(servers)
         }
+    
+    def get_combined_server_info_json(self) -> bytes:
+        """
+        Get combined server information as pre-serialized JSON
+        
+        Returns:
+            JSON object of get_combined_server_info(), cached until servers change
+        """
+        return self._server_info_json
@@ -3,18 +3,23 @@ Main HTTP Server for Multiple MCP Servers
 Manages and routes requests to different MCP servers
 """
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from typing import Any, AsyncIterator, Dict, List
+from pathlib import Path
+import asyncio
+import os
 import uvicorn
-import json
+import orjson
 import logging
 from contextlib import asynccontextmanager
 
 # Import core components
+from core.base_server import RESULT_JSON_OPTION
 from core.registry import ServerRegistry
 
 # Import available servers
-from servers.crypto_price import CryptoPriceServer
+from servers.crypto_price import CryptoPriceServer, get_client, aclose_client
 from servers.sun_docs import SunDocsServer
 
 logging.basicConfig(
@@ -41,6 +46,9 @@ async def lifespan(app: FastAPI):
     sun_docs_server = SunDocsServer()
     registry.register(sun_docs_server)
     
+    # One HTTP/2 client for the whole process lifetime
+    get_client()
+    
     logger.info(f"📦 Registered {len(registry.list_servers())} server(s)")
     for server_info in registry.list_servers():
         logger.info(f"   - {server_info['name']} v{server_info['version']}")
@@ -48,6 +56,7 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down...")
+    await aclose_client()
 
 
 app = FastAPI(title="MCP Multi-Server", lifespan=lifespan)
@@ -73,121 +82,192 @@ async def root():
     }
 
 
-@app.post("/sse")
-async def handle_sse_request(request: Request):
-    """SSE endpoint for MCP (GitHub Copilot compatibility)"""
-    try:
-        # Parse JSON-RPC request
-        body = await request.body()
-        message = json.loads(body.decode('utf-8'))
+# Static part of the initialize result; only serverInfo is spliced in per request
+INITIALIZE_RESULT_PREFIX = b'{"protocolVersion":"2024-11-05","capabilities":{"tools":{}},"serverInfo":'
+
+
+def rpc_result(msg_id: Any, result_json: bytes) -> bytes:
+    """Wrap an already-serialized result in a JSON-RPC response envelope"""
+    return b'{"jsonrpc":"2.0","id":' + orjson.dumps(msg_id) + b',"result":' + result_json + b'}'
+
+
+async def handle_message(message: Dict[str, Any]) -> bytes:
+    """Handle a single JSON-RPC message and return its serialized response"""
+    method = message.get('method', 'unknown')
+    msg_id = message.get('id')
+    
+    logger.info("📨 Request: %s (id=%s)", method, msg_id)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full message: %s", message)
+    
+    # Handle different MCP methods
+    if method == "initialize":
+        # Server info is pre-serialized by the registry
+        response = rpc_result(
+            msg_id,
+            INITIALIZE_RESULT_PREFIX + registry.get_combined_server_info_json() + b'}'
+        )
         
-        method = message.get('method', 'unknown')
-        msg_id = message.get('id')
+    elif method == "notifications/initialized":
+        # Notification - no response needed
+        logger.info("✓ Client initialized")
+        return b'{"jsonrpc":"2.0","result":null}'
         
-        logger.info(f"📨 Request: {method} (id={msg_id})")
-        logger.debug(f"Full message: {message}")
+    elif method == "tools/list":
+        # Return list of all available tools from all servers (pre-serialized by the registry)
+        response = rpc_result(msg_id, b'{"tools":' + registry.get_all_tools_json() + b'}')
         
-        # Handle different MCP methods
-        if method == "initialize":
-            server_info = registry.get_combined_server_info()
-            response = {
-                "jsonrpc": "2.0",
-                "id": msg_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {}
-                    },
-                    "serverInfo": server_info
-                }
-            }
+    elif method == "tools/call":
+        # Call tool
+        tool_name = message["params"]["name"]
+        arguments = message["params"].get("arguments", {})
+        
+        logger.info("🔧 Calling tool: %s with args: %s", tool_name, arguments)
+        
+        try:
+            # Call tool through registry
+            result = await registry.call_tool(tool_name, arguments)
             
-        elif method == "notifications/initialized":
-            # Notification - no response needed
-            logger.info("✓ Client initialized")
-            return {"jsonrpc": "2.0", "result": None}
+            logger.info("✓ Tool %s executed successfully", tool_name)
             
-        elif method == "tools/list":
-            # Return list of all available tools from all servers
-            all_tools = registry.get_all_tools()
+            # Format response
+            result_text = orjson.dumps(result, option=RESULT_JSON_OPTION).decode()
             
-            response = {
+            response = orjson.dumps({
                 "jsonrpc": "2.0",
                 "id": msg_id,
                 "result": {
-                    "tools": all_tools
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": result_text
+                        }
+                    ]
                 }
-            }
+            })
             
-        elif method == "tools/call":
-            # Call tool
-            tool_name = message["params"]["name"]
-            arguments = message["params"].get("arguments", {})
-            
-            logger.info(f"🔧 Calling tool: {tool_name} with args: {arguments}")
-            
-            try:
-                # Call tool through registry
-                result = await registry.call_tool(tool_name, arguments)
-                
-                logger.info(f"✓ Tool {tool_name} executed successfully")
-                
-                # Format response
-                result_text = json.dumps(result, ensure_ascii=False, indent=2)
-                
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": msg_id,
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": result_text
-                            }
-                        ]
-                    }
-                }
-                
-            except Exception as e:
-                logger.error(f"Tool execution error: {e}", exc_info=True)
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": msg_id,
-                    "error": {
-                        "code": -32603,
-                        "message": f"Tool execution failed: {str(e)}"
-                    }
-                }
-        
-        else:
-            # Unknown method
-            logger.warning(f"Unknown method: {method}")
-            response = {
+        except Exception as e:
+            logger.error("Tool execution error: %s", e, exc_info=True)
+            response = orjson.dumps({
                 "jsonrpc": "2.0",
                 "id": msg_id,
                 "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {method}"
+                    "code": -32603,
+                    "message": f"Tool execution failed: {str(e)}"
                 }
+            })
+    
+    else:
+        # Unknown method
+        logger.warning("Unknown method: %s", method)
+        response = orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": msg_id,
+            "error": {
+                "code": -32601,
+                "message": f"Method not found: {method}"
             }
+        })
+    
+    logger.info("✓ Sending response for %s", method)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response: %s", response)
+    return response
+
+
+async def safe_handle_message(message: Any) -> bytes:
+    """Handle one message of a batch, turning failures into a JSON-RPC error"""
+    try:
+        return await handle_message(message)
+    except Exception as e:
+        logger.error("Error: %s", e, exc_info=True)
+        return orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": message.get("id") if isinstance(message, dict) else None,
+            "error": {"code": -32603, "message": str(e)}
+        })
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """Build a JSON response from serialized bytes or an object (skips FastAPI's encoder)"""
+    body = content if isinstance(content, bytes) else orjson.dumps(content)
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def cancel_unfinished(tasks: List[asyncio.Task]) -> None:
+    """Cancel handlers still running when a stream ends early (e.g. client disconnect)"""
+    for task in tasks:
+        task.cancel()
+
+
+async def stream_events(messages: List[Any]) -> AsyncIterator[bytes]:
+    """Yield one SSE event per response, in the order they complete"""
+    tasks = [asyncio.ensure_future(safe_handle_message(m)) for m in messages]
+    try:
+        for next_response in asyncio.as_completed(tasks):
+            yield b"data: " + await next_response + b"\n\n"
+    finally:
+        cancel_unfinished(tasks)
+
+
+async def stream_json_array(messages: List[Any]) -> AsyncIterator[bytes]:
+    """Yield a JSON array of responses chunk by chunk, in the order they complete
+    
+    JSON-RPC batch responses are matched by id, so their order is free.
+    """
+    tasks = [asyncio.ensure_future(safe_handle_message(m)) for m in messages]
+    try:
+        separator = b"["
+        for next_response in asyncio.as_completed(tasks):
+            yield separator + await next_response
+            separator = b","
+        yield b"]"
+    finally:
+        cancel_unfinished(tasks)
+
+
+@app.post("/sse")
+async def handle_sse_request(request: Request):
+    """SSE endpoint for MCP (GitHub Copilot compatibility)
+    
+    Accepts a single JSON-RPC message or a batch (list). Clients that accept
+    text/event-stream get each response as its own SSE event as soon as it is
+    ready; other clients get a plain JSON body.
+    """
+    message = None
+    try:
+        # Parse JSON-RPC request
+        body = await request.body()
+        message = orjson.loads(body)
+        
+        is_batch = isinstance(message, list)
+        messages = message if is_batch else [message]
+        
+        # An empty batch is itself an invalid request (JSON-RPC 2.0)
+        if not messages:
+            return json_response(
+                {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+            )
+        
+        if "text/event-stream" in request.headers.get("accept", ""):
+            return StreamingResponse(stream_events(messages), media_type="text/event-stream")
         
-        # Return response - let FastAPI handle JSON encoding
-        logger.info(f"✓ Sending response for {method}")
-        logger.debug(f"Response: {response}")
-        return response
+        if is_batch:
+            return StreamingResponse(stream_json_array(messages), media_type="application/json")
+        return json_response(await handle_message(message))
         
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON: {e}")
-        return JSONResponse(
+    except orjson.JSONDecodeError as e:
+        logger.error("Invalid JSON: %s", e)
+        return json_response(
             {"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}},
             status_code=400
         )
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
-        return JSONResponse(
+        logger.error("Error: %s", e, exc_info=True)
+        return json_response(
             {
                 "jsonrpc": "2.0",
-                "id": message.get("id") if 'message' in locals() else None,
+                "id": message.get("id") if isinstance(message, dict) else None,
                 "error": {"code": -32603, "message": str(e)}
             },
             status_code=500
@@ -220,11 +300,18 @@ def main():
     logger.info(f"📝 Endpoint: POST http://{host}:{port}/sse")
     logger.info("=" * 60)
     
+    # Workers require the app as an import string
     uvicorn.run(
-        app,
+        "main:app",
+        app_dir=str(Path(__file__).parent),
         host=host,
         port=port,
-        log_level="info"
+        # "auto" picks uvloop when installed (it has no Windows build) and asyncio otherwise
+        loop="auto",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+        log_level="info",
+        access_log=False
     )
 
 
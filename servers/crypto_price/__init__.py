@@ -1,4 +1,5 @@
 """Crypto Price MCP Server Module"""
 from .server import CryptoPriceServer
+from ._http import get_client, aclose_client
 
-__all__ = ['CryptoPriceServer']
+__all__ = ['CryptoPriceServer', 'get_client', 'aclose_client']
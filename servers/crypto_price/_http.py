@@ -0,0 +1,37 @@
+"""
+Shared HTTP client for Crypto Price tools
+Keeps a pooled keep-alive connection to Binance across tool calls
+"""
+from typing import Optional
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        # With HTTP/2, concurrent requests multiplex over one connection, so only
+        # a few keep-alive connections are needed. Keep them for 60s (httpx
+        # defaults to 5s) so bursts of tool calls seconds apart skip the TLS handshake.
+        # The transport retries failed connection attempts; retries on error
+        # statuses (429/5xx) are handled by the callers.
+        _client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=8, keepalive_expiry=60.0),
+                retries=2
+            ),
+            timeout=10.0,
+            headers={"Accept": "application/json"}
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -2,17 +2,43 @@
 Crypto Price Tools Module
 Provides functions to fetch cryptocurrency prices from Binance
 """
+import asyncio
+import functools
+import json
 import logging
-import requests
-from typing import Dict, Any
+import os
+import types
+import httpx
+import orjson
+from cachetools import TTLCache
+from typing import Dict, Any, List, Optional
+from ._http import get_client
 
 logger = logging.getLogger('CryptoPrice.Tools')
 
 # Binance API endpoint
 BINANCE_API_URL = "https://api.binance.com/api/v3/ticker/price"
 
-# Mapping Vietnamese/English names to symbols for better understanding
-CRYPTO_NAME_TO_SYMBOL = {
+# Max in-flight per-symbol requests (multiplexed as HTTP/2 streams over the shared connection)
+MAX_CONCURRENT_REQUESTS = 16
+
+# Retry policy for Binance error responses (rate limiting and server errors)
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.1
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# How long (seconds) a fetched price is served from memory
+CRYPTO_PRICE_TTL = float(os.getenv('CRYPTO_PRICE_TTL', '2.0'))
+PRICE_CACHE_MAXSIZE = 512
+
+# Trading pair -> successful result; entries expire after CRYPTO_PRICE_TTL
+_price_cache: TTLCache = TTLCache(maxsize=PRICE_CACHE_MAXSIZE, ttl=CRYPTO_PRICE_TTL)
+
+# Trading pair -> fetch currently in flight for that pair
+_inflight: Dict[str, asyncio.Task] = {}
+
+# Mapping Vietnamese/English names to symbols for better understanding (read-only)
+CRYPTO_NAME_TO_SYMBOL = types.MappingProxyType({
     'bitcoin': 'BTC',
     'btc': 'BTC',
     'ethereum': 'ETH',
@@ -37,7 +63,10 @@ CRYPTO_NAME_TO_SYMBOL = {
     'polygon': 'MATIC',
     'litecoin': 'LTC',
     'ltc': 'LTC',
-}
+})
+
+# Canonical symbols the name map produces
+_KNOWN_SYMBOLS = frozenset(CRYPTO_NAME_TO_SYMBOL.values())
 
 
 def normalize_symbol(symbol: str) -> str:
@@ -48,12 +77,25 @@ def normalize_symbol(symbol: str) -> str:
         'ethereum' → 'ETH'
         'BTC' → 'BTC'
     """
-    symbol_lower = symbol.lower().strip()
-    return CRYPTO_NAME_TO_SYMBOL.get(symbol_lower, symbol.upper().strip())
+    symbol = symbol.strip()
+    # Fastest path: already canonical (e.g. 'BTC'), no case conversion needed
+    if symbol in _KNOWN_SYMBOLS:
+        return symbol
+    symbol_upper = symbol.upper()
+    # Fast path: a known symbol in another case (e.g. 'btc')
+    if symbol_upper in _KNOWN_SYMBOLS:
+        return symbol_upper
+    return CRYPTO_NAME_TO_SYMBOL.get(symbol.lower(), symbol_upper)
 
 
 def format_price(price: float) -> str:
     """Format price by removing trailing zeros."""
+    return _format_price_cached(round(price, 8))
+
+
+@functools.lru_cache(maxsize=512)
+def _format_price_cached(price: float) -> str:
+    """Cached formatter behind format_price (prices repeat across calls)"""
     if price >= 1:
         # For prices >= 1, show 2-4 decimals
         return f"{price:,.4f}".rstrip('0').rstrip('.')
@@ -62,7 +104,62 @@ def format_price(price: float) -> str:
         return f"{price:.8f}".rstrip('0').rstrip('.')
 
 
-def get_crypto_price(symbol: str) -> Dict[str, Any]:
+async def _get_with_retry(params: Dict[str, str]) -> httpx.Response:
+    """GET the Binance ticker endpoint, retrying on rate limiting or server errors"""
+    for attempt in range(MAX_RETRIES):
+        response = await get_client().get(BINANCE_API_URL, params=params)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+    return await get_client().get(BINANCE_API_URL, params=params)
+
+
+async def _fetch_price(trading_pair: str) -> Dict[str, Any]:
+    """Fetch one trading pair from Binance (network errors propagate)"""
+    logger.info("Fetching price for %s...", trading_pair)
+    
+    # Make request to Binance API
+    params = {'symbol': trading_pair}
+    response = await _get_with_retry(params)
+    
+    # Check if request was successful
+    if response.status_code == 200:
+        data = orjson.loads(response.content)
+        price = float(data['price'])
+        price_str = format_price(price)
+        
+        logger.info("Price for %s: $%s", trading_pair, price_str)
+        
+        return {
+            'success': True,
+            'symbol': trading_pair,
+            'price': price,
+            'currency': 'USDT',
+            'message': f'Current price of {trading_pair} is ${price_str}'
+        }
+    else:
+        # Handle error responses
+        error_msg = f"Error fetching price for {trading_pair}: HTTP {response.status_code}"
+        logger.error(error_msg)
+        
+        return {
+            'success': False,
+            'symbol': trading_pair,
+            'error': error_msg,
+            'message': f'Failed to get price for {trading_pair}. Please check if the symbol is correct.'
+        }
+
+
+def _to_pair(symbol: str) -> str:
+    """Resolve user input to a USDT trading pair (e.g. 'bitcoin' -> 'BTCUSDT')"""
+    # Normalize symbol: convert names like 'bitcoin' to 'BTC'
+    symbol = normalize_symbol(symbol)
+    
+    # If user only provides base currency (e.g., 'BTC'), add 'USDT'
+    return symbol if symbol.endswith('USDT') else f"{symbol}USDT"
+
+
+async def get_crypto_price(symbol: str) -> Dict[str, Any]:
     """Get current real-time cryptocurrency price from Binance exchange.
     
     Args:
@@ -79,56 +176,61 @@ def get_crypto_price(symbol: str) -> Dict[str, Any]:
         - message: Human-readable price message
     """
     try:
-        # Normalize symbol: convert names like 'bitcoin' to 'BTC'
-        symbol = normalize_symbol(symbol)
-        
-        # If user only provides base currency (e.g., 'BTC'), add 'USDT'
-        if not symbol.endswith('USDT'):
-            trading_pair = f"{symbol}USDT"
-        else:
-            trading_pair = symbol
+        trading_pair = _to_pair(symbol)
+    except Exception as e:
+        # Handle malformed input (e.g. a non-string symbol)
+        error_msg = f"Unexpected error: {str(e)}"
+        logger.error(error_msg)
         
-        logger.info(f"Fetching price for {trading_pair}...")
+        return {
+            'success': False,
+            'symbol': symbol,
+            'error': error_msg,
+            'message': 'An unexpected error occurred. Please try again.'
+        }
+    
+    return await _get_pair_price(trading_pair)
+
+
+async def _fetch_and_cache(trading_pair: str) -> Dict[str, Any]:
+    """Fetch one trading pair and cache it if successful"""
+    result = await _fetch_price(trading_pair)
+    if result['success'] and CRYPTO_PRICE_TTL > 0:
+        _price_cache[trading_pair] = result
+    return result
+
+
+def _clear_inflight(trading_pair: str, task: asyncio.Task) -> None:
+    """Forget a finished fetch (unless a newer one has replaced it)"""
+    if _inflight.get(trading_pair) is task:
+        del _inflight[trading_pair]
+
+
+async def _get_pair_price(trading_pair: str) -> Dict[str, Any]:
+    """Get the price of an already-resolved trading pair (cached, one fetch per pair)"""
+    try:
+        # Serve repeated queries inside the TTL window from memory
+        cached = _price_cache.get(trading_pair)
+        if cached is not None:
+            return cached
         
-        # Make request to Binance API
-        params = {'symbol': trading_pair}
-        response = requests.get(BINANCE_API_URL, params=params, timeout=10)
+        # Only one fetch per pair at a time; concurrent callers share its outcome
+        task = _inflight.get(trading_pair)
+        if task is None:
+            task = asyncio.ensure_future(_fetch_and_cache(trading_pair))
+            _inflight[trading_pair] = task
+            task.add_done_callback(functools.partial(_clear_inflight, trading_pair))
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
         
-        # Check if request was successful
-        if response.status_code == 200:
-            data = response.json()
-            price = float(data['price'])
-            price_str = format_price(price)
-            
-            logger.info(f"Price for {trading_pair}: ${price_str}")
-            
-            return {
-                'success': True,
-                'symbol': trading_pair,
-                'price': price,
-                'currency': 'USDT',
-                'message': f'Current price of {trading_pair} is ${price_str}'
-            }
-        else:
-            # Handle error responses
-            error_msg = f"Error fetching price for {trading_pair}: HTTP {response.status_code}"
-            logger.error(error_msg)
-            
-            return {
-                'success': False,
-                'symbol': trading_pair,
-                'error': error_msg,
-                'message': f'Failed to get price for {trading_pair}. Please check if the symbol is correct.'
-            }
-            
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         # Handle network/connection errors
-        error_msg = f"Network error while fetching {symbol}: {str(e)}"
+        error_msg = f"Network error while fetching {trading_pair}: {str(e)}"
         logger.error(error_msg)
         
         return {
             'success': False,
-            'symbol': symbol,
+            'symbol': trading_pair,
             'error': error_msg,
             'message': 'Network error occurred. Please try again later.'
         }
@@ -139,13 +241,35 @@ def get_crypto_price(symbol: str) -> Dict[str, Any]:
         
         return {
             'success': False,
-            'symbol': symbol,
+            'symbol': trading_pair,
             'error': error_msg,
             'message': 'An unexpected error occurred. Please try again.'
         }
 
 
-def get_multiple_prices(symbols: str) -> Dict[str, Any]:
+async def _fetch_prices_batch(trading_pairs: List[str]) -> Optional[Dict[str, float]]:
+    """Fetch several trading pairs in a single Binance request.
+    
+    Returns:
+        Mapping of trading pair to price, or None if Binance rejected the batch
+        as a bad request (e.g. one of the symbols does not exist)
+    
+    Raises:
+        httpx.HTTPStatusError: On rate limiting or server errors, where falling
+            back to one request per symbol would only add load
+    """
+    params = {'symbols': json.dumps(trading_pairs, separators=(',', ':'))}
+    response = await _get_with_retry(params)
+    
+    if 400 <= response.status_code < 500 and response.status_code != 429:
+        logger.warning("Batch request for %d pairs rejected: HTTP %d", len(trading_pairs), response.status_code)
+        return None
+    response.raise_for_status()
+    
+    return {item['symbol']: float(item['price']) for item in orjson.loads(response.content)}
+
+
+async def get_multiple_prices(symbols: str) -> Dict[str, Any]:
     """Get prices for multiple cryptocurrencies at once from Binance.
     
     Args:
@@ -171,19 +295,40 @@ def get_multiple_prices(symbols: str) -> Dict[str, Any]:
                 'message': 'Please provide at least one cryptocurrency symbol'
             }
         
-        logger.info(f"Fetching prices for {len(symbol_list)} cryptocurrencies...")
+        logger.info("Fetching prices for %d cryptocurrencies...", len(symbol_list))
+        
+        # Resolve each input to its trading pair once (e.g. 'bitcoin' -> 'BTCUSDT')
+        requested = [(symbol, _to_pair(symbol)) for symbol in symbol_list]
         
         prices = {}
         errors = []
         
-        # Fetch price for each symbol
-        for symbol in symbol_list:
-            result = get_crypto_price(symbol)
+        # Fetch every pair in one round-trip
+        batch = await _fetch_prices_batch(list(dict.fromkeys(pair for _, pair in requested)))
+        
+        if batch is not None:
+            for symbol, trading_pair in requested:
+                if trading_pair in batch:
+                    prices[trading_pair] = format_price(batch[trading_pair])
+                else:
+                    errors.append(f"{symbol}: No price returned for {trading_pair}")
+        else:
+            # Batch rejected - fall back to concurrent per-symbol lookups for per-symbol errors
+            semaphore = asyncio.Semaphore(min(MAX_CONCURRENT_REQUESTS, len(symbol_list)))
             
-            if result['success']:
-                prices[result['symbol']] = format_price(result['price'])
-            else:
-                errors.append(f"{symbol}: {result.get('error', 'Unknown error')}")
+            async def fetch(trading_pair: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await _get_pair_price(trading_pair)
+            
+            results = await asyncio.gather(*[fetch(pair) for _, pair in requested], return_exceptions=True)
+            
+            for (symbol, _), result in zip(requested, results):
+                if isinstance(result, Exception):
+                    errors.append(f"{symbol}: {str(result)}")
+                elif result['success']:
+                    prices[result['symbol']] = format_price(result['price'])
+                else:
+                    errors.append(f"{symbol}: {result.get('error', 'Unknown error')}")
         
         # Prepare response
         if prices:
@@ -206,6 +351,16 @@ def get_multiple_prices(symbols: str) -> Dict[str, Any]:
                 'message': 'Failed to retrieve any prices'
             }
             
+    except httpx.HTTPError as e:
+        # Handle network/connection errors
+        error_msg = f"Network error while fetching {symbols}: {str(e)}"
+        logger.error(error_msg)
+        
+        return {
+            'success': False,
+            'error': error_msg,
+            'message': 'Network error occurred. Please try again later.'
+        }
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         logger.error(error_msg)
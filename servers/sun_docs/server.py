@@ -9,83 +9,86 @@ from .tools import search_docs, list_all_docs, get_doc_by_name, get_docs_by_cate
 
 logger = logging.getLogger('SunDocsServer')
 
+# Tool descriptors are static, so they are built once at import
+_TOOLS: List[Dict[str, Any]] = [
+    {
+        "name": "search_docs",
+        "description": "Search documentation by keyword in name or description. Use this when user asks: 'tìm tài liệu về server', 'search docs about billing', 'có tài liệu nào về security không?'",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search keyword (searches in document name and description)"
+                }
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "list_all_docs",
+        "description": "List all available documentation links. Use when user asks: 'show all docs', 'danh sách tài liệu', 'có những tài liệu gì?'",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    {
+        "name": "get_doc_by_name",
+        "description": "Get a specific document by exact name. Use when user asks for specific document: 'show me Sun SV doc', 'tài liệu IP List'",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Document name (case insensitive)"
+                }
+            },
+            "required": ["name"]
+        }
+    },
+    {
+        "name": "get_docs_by_category",
+        "description": "Get documents by category keyword. Use for category searches: 'server documents', 'security docs', 'billing information'",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "Category keyword (e.g., 'server', 'security', 'billing', 'IP', 'meeting')"
+                }
+            },
+            "required": ["category"]
+        }
+    }
+]
+
 
 class SunDocsServer(BaseMCPServer):
     """MCP Server for Sun documentation links"""
     
     def __init__(self):
         super().__init__(name="SunDocs", version="1.0.0")
+        # Tool name -> function
+        self._handlers = {
+            "search_docs": search_docs,
+            "list_all_docs": lambda **_: list_all_docs(),  # takes no arguments
+            "get_doc_by_name": get_doc_by_name,
+            "get_docs_by_category": get_docs_by_category,
+        }
         self.logger.info("Sun Docs Server initialized")
     
     def get_tools(self) -> List[Dict[str, Any]]:
         """Return list of available tools"""
-        return [
-            {
-                "name": "search_docs",
-                "description": "Search documentation by keyword in name or description. Use this when user asks: 'tìm tài liệu về server', 'search docs about billing', 'có tài liệu nào về security không?'",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search keyword (searches in document name and description)"
-                        }
-                    },
-                    "required": ["query"]
-                }
-            },
-            {
-                "name": "list_all_docs",
-                "description": "List all available documentation links. Use when user asks: 'show all docs', 'danh sách tài liệu', 'có những tài liệu gì?'",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "get_doc_by_name",
-                "description": "Get a specific document by exact name. Use when user asks for specific document: 'show me Sun SV doc', 'tài liệu IP List'",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Document name (case insensitive)"
-                        }
-                    },
-                    "required": ["name"]
-                }
-            },
-            {
-                "name": "get_docs_by_category",
-                "description": "Get documents by category keyword. Use for category searches: 'server documents', 'security docs', 'billing information'",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "category": {
-                            "type": "string",
-                            "description": "Category keyword (e.g., 'server', 'security', 'billing', 'IP', 'meeting')"
-                        }
-                    },
-                    "required": ["category"]
-                }
-            }
-        ]
+        return _TOOLS
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool"""
-        self.logger.info(f"Calling tool: {tool_name} with args: {arguments}")
+        self.logger.info("Calling tool: %s with args: %s", tool_name, arguments)
         
-        if tool_name == "search_docs":
-            result = search_docs(**arguments)
-        elif tool_name == "list_all_docs":
-            result = list_all_docs()
-        elif tool_name == "get_doc_by_name":
-            result = get_doc_by_name(**arguments)
-        elif tool_name == "get_docs_by_category":
-            result = get_docs_by_category(**arguments)
-        else:
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
         
-        return result
+        return handler(**arguments)
@@ -2,9 +2,11 @@
 Sun Docs Tools Module
 Provides functions to search and retrieve documentation links
 """
-import json
 import logging
-from typing import Dict, Any, List, Optional
+import orjson
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger('SunDocs.Tools')
@@ -13,16 +15,85 @@ logger = logging.getLogger('SunDocs.Tools')
 DOCS_FILE = Path(__file__).parent.parent.parent / "SUN-LINKS.json"
 
 
-def load_docs() -> List[Dict[str, str]]:
-    """Load documentation links from JSON file"""
+# Separators that never occur in search text: between name and description,
+# and between documents in the search corpus
+FIELD_SEP = '\x1f'
+DOC_SEP = b'\x00'
+
+
+class DocsIndex(NamedTuple):
+    """Loaded docs plus precomputed lower-cased search data"""
+    docs: Tuple[Dict[str, str], ...]
+    # Lower-cased names, parallel to docs
+    names: Tuple[str, ...]
+    # All lower-cased "name<FIELD_SEP>description" entries as UTF-8, joined by DOC_SEP
+    corpus: bytes
+    # Byte offset in corpus where each doc's entry starts
+    starts: Tuple[int, ...]
+
+
+EMPTY_INDEX = DocsIndex((), (), b'', ())
+
+
+@lru_cache(maxsize=1)
+def _load_cached(mtime: float) -> DocsIndex:
+    """Read, parse and index the JSON file (cached until its mtime changes)"""
+    docs = tuple(orjson.loads(DOCS_FILE.read_bytes()))
+    names = tuple(doc.get('name', '').lower() for doc in docs)
+    
+    entries = [
+        (name + FIELD_SEP + doc.get('description', '').lower()).encode('utf-8')
+        for name, doc in zip(names, docs)
+    ]
+    starts = []
+    offset = 0
+    for entry in entries:
+        starts.append(offset)
+        offset += len(entry) + len(DOC_SEP)
+    
+    logger.info(f"Loaded {len(docs)} documentation links")
+    return DocsIndex(docs, names, DOC_SEP.join(entries), tuple(starts))
+
+
+def _load_docs_index() -> DocsIndex:
+    """Load documentation links together with their lower-cased search index"""
     try:
-        with open(DOCS_FILE, 'r', encoding='utf-8') as f:
-            docs = json.load(f)
-            logger.info(f"Loaded {len(docs)} documentation links")
-            return docs
+        return _load_cached(DOCS_FILE.stat().st_mtime)
     except Exception as e:
         logger.error(f"Error loading docs: {e}")
+        return EMPTY_INDEX
+
+
+def load_docs() -> Tuple[Dict[str, str], ...]:
+    """Load documentation links from JSON file"""
+    return _load_docs_index().docs
+
+
+def _match_docs(docs_index: DocsIndex, keyword: str) -> List[Dict[str, str]]:
+    """Return docs whose name or description contains keyword (case insensitive)
+    
+    Scans the whole corpus with bytes.find (a C-level search) and maps each hit
+    back to its document, instead of testing every document in Python.
+    """
+    needle = keyword.lower().encode('utf-8')
+    if FIELD_SEP.encode() in needle or DOC_SEP in needle:
+        # Could only match across field/document boundaries
         return []
+    
+    docs, _, corpus, starts = docs_index
+    results = []
+    pos = 0
+    while True:
+        hit = corpus.find(needle, pos)
+        if hit < 0:
+            break
+        i = bisect_right(starts, hit) - 1
+        results.append(docs[i])
+        if i + 1 >= len(starts):
+            break
+        # Skip to the next document so each doc is reported once
+        pos = starts[i + 1]
+    return results
 
 
 def search_docs(query: str) -> Dict[str, Any]:
@@ -40,9 +111,9 @@ def search_docs(query: str) -> Dict[str, Any]:
         - query: The search query used
     """
     try:
-        docs = load_docs()
+        docs_index = _load_docs_index()
         
-        if not docs:
+        if not docs_index.docs:
             return {
                 'success': False,
                 'error': 'No documentation available',
@@ -50,14 +121,9 @@ def search_docs(query: str) -> Dict[str, Any]:
             }
         
         # Search in name and description (case insensitive)
-        query_lower = query.lower()
-        results = [
-            doc for doc in docs
-            if query_lower in doc.get('name', '').lower() or 
-               query_lower in doc.get('description', '').lower()
-        ]
+        results = _match_docs(docs_index, query)
         
-        logger.info(f"Search '{query}' found {len(results)} results")
+        logger.info("Search '%s' found %d results", query, len(results))
         
         return {
             'success': True,
@@ -97,7 +163,7 @@ def list_all_docs() -> Dict[str, Any]:
                 'message': 'Failed to load documentation file'
             }
         
-        logger.info(f"Retrieved {len(docs)} documents")
+        logger.info("Retrieved %d documents", len(docs))
         
         return {
             'success': True,
@@ -129,9 +195,9 @@ def get_doc_by_name(name: str) -> Dict[str, Any]:
         - doc: The document information
     """
     try:
-        docs = load_docs()
+        docs_index = _load_docs_index()
         
-        if not docs:
+        if not docs_index.docs:
             return {
                 'success': False,
                 'error': 'No documentation available',
@@ -141,12 +207,12 @@ def get_doc_by_name(name: str) -> Dict[str, Any]:
         # Find document by name (case insensitive)
         name_lower = name.lower()
         doc = next(
-            (d for d in docs if d.get('name', '').lower() == name_lower),
+            (d for d, doc_name in zip(docs_index.docs, docs_index.names) if doc_name == name_lower),
             None
         )
         
         if doc:
-            logger.info(f"Found document: {doc['name']}")
+            logger.info("Found document: %s", doc['name'])
             return {
                 'success': True,
                 'doc': doc,
@@ -180,9 +246,9 @@ def get_docs_by_category(category: str) -> Dict[str, Any]:
         Dictionary containing matching documents
     """
     try:
-        docs = load_docs()
+        docs_index = _load_docs_index()
         
-        if not docs:
+        if not docs_index.docs:
             return {
                 'success': False,
                 'error': 'No documentation available',
@@ -190,14 +256,9 @@ def get_docs_by_category(category: str) -> Dict[str, Any]:
             }
         
         # Search by category keyword
-        category_lower = category.lower()
-        results = [
-            doc for doc in docs
-            if category_lower in doc.get('name', '').lower() or
-               category_lower in doc.get('description', '').lower()
-        ]
-        
-        logger.info(f"Category '{category}' found {len(results)} results")
+        results = _match_docs(docs_index, category)
+        
+        logger.info("Category '%s' found %d results", category, len(results))
         
         return {
             'success': True,